@@ -15,11 +15,8 @@ import re
 import pickle
 import os
 import csv
+from collections import Counter
 from typing import Dict, List, Tuple, Optional
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-from nltk.tokenize import word_tokenize
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import train_test_split
@@ -27,23 +24,11 @@ from sklearn.naive_bayes import MultinomialNB
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, accuracy_score
 import numpy as np
+from nlp import preprocess_text
 
 
-# Ensure NLTK resources are available
-def _ensure_nltk():
-    try:
-        _ = stopwords.words("english")
-        word_tokenize("test")
-    except LookupError:
-        nltk.download("stopwords")
-        nltk.download("punkt")
-        try:
-            nltk.download("punkt_tab")
-        except Exception:
-            pass
-
-
-_ensure_nltk()
+# Classifier tokens are letters only; digits and symbols are separators
+_TOKEN_RE = re.compile(r"[a-z]+")
 
 
 class DocumentClassificationSystem:
@@ -57,8 +42,6 @@ class DocumentClassificationSystem:
         """
         self.model_type = model_type
         self.data_dir = data_dir
-        self.stemmer = PorterStemmer()
-        self.stop_words = set(stopwords.words("english"))
         self.vectorizer = None
         self.model = None
         self.is_trained = False
@@ -77,10 +60,10 @@ class DocumentClassificationSystem:
         categories = []
 
         try:
-            with open(categories_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    categories.append(row["category"])
+            with open(categories_file, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                col = next(reader, ["category"]).index("category")
+                categories = [row[col] for row in reader if row]
         except FileNotFoundError:
             # Fallback to default categories
             categories = ["politics", "business", "health"]
@@ -93,10 +76,17 @@ class DocumentClassificationSystem:
         documents = []
 
         try:
-            with open(training_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    documents.append({"text": row["text"], "category": row["category"]})
+            # plain csv.reader: rows come back as lists, so no per-row dict
+            # is built just to read two columns out of it
+            with open(training_file, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, ["text", "category"])
+                text_col, cat_col = header.index("text"), header.index("category")
+                documents = [
+                    {"text": row[text_col], "category": row[cat_col]}
+                    for row in reader
+                    if row
+                ]
             print(f"Loaded {len(documents)} training documents from {training_file}")
         except FileNotFoundError:
             print(f"Training file {training_file} not found, using fallback data")
@@ -137,12 +127,9 @@ class DocumentClassificationSystem:
 
     def get_training_stats(self) -> Dict:
         """Get statistics about the training data"""
-        stats = {}
-        for category in self.categories:
-            count = sum(
-                1 for doc in self.training_documents if doc["category"] == category
-            )
-            stats[category] = count
+        # Count every document once instead of rescanning per category
+        counts = Counter(doc["category"] for doc in self.training_documents)
+        stats = {category: counts[category] for category in self.categories}
         stats["total"] = len(self.training_documents)
         return stats
 
@@ -156,23 +143,9 @@ class DocumentClassificationSystem:
         Returns:
             str: Preprocessed text
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove punctuation and special characters
-        text = re.sub(r"[^a-zA-Z\s]", " ", text)
-
-        # Tokenize
-        tokens = word_tokenize(text)
-
-        # Remove stopwords and stem
-        processed_tokens = [
-            self.stemmer.stem(token)
-            for token in tokens
-            if token not in self.stop_words and len(token) > 2
-        ]
-
-        return " ".join(processed_tokens)
+        # Lowercase, tokenize (punctuation, digits and other symbols are
+        # separators), remove stopwords and short tokens, and stem
+        return preprocess_text(text, token_re=_TOKEN_RE, min_len=3)
 
     def train_model(self) -> Dict:
         """
@@ -241,40 +214,62 @@ class DocumentClassificationSystem:
         Returns:
             Dict: Classification results
         """
-        if not self.is_trained:
-            raise ValueError("Model must be trained before classification")
+        return self.classify_documents([text])[0]
 
-        # Preprocess text
-        processed_text = self.preprocess_text(text)
-
-        # Vectorize
-        text_vec = self.vectorizer.transform([processed_text])
+    def classify_documents(self, texts: List[str]) -> List[Dict]:
+        """
+        Classify a batch of texts with one vectorizer and one model call
 
-        # Predict
-        prediction = self.model.predict(text_vec)[0]
-        probabilities = self.model.predict_proba(text_vec)[0]
+        Args:
+            texts (List[str]): Texts to classify
 
-        # Prepare results
-        category = self.label_decoder[prediction]
-        confidence = probabilities[prediction]
+        Returns:
+            List[Dict]: Classification results, in the same order as texts
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before classification")
+        if not texts:
+            return []
 
-        # Get probabilities for all categories
-        prob_dict = {
-            self.label_decoder[i]: prob for i, prob in enumerate(probabilities)
-        }
+        # Preprocess texts
+        processed_texts = [self.preprocess_text(text) for text in texts]
 
-        # Generate explanation
-        explanation = self._generate_explanation(category, confidence, prob_dict)
+        # Vectorize the whole batch into one sparse matrix
+        text_vecs = self.vectorizer.transform(processed_texts)
+
+        # Predict (a single model pass; the predicted class is the argmax of
+        # the probabilities, so calling predict() separately is redundant)
+        probabilities = self.model.predict_proba(text_vecs)
+        best = probabilities.argmax(axis=1)
+        categories = [self.label_decoder[label] for label in self.model.classes_]
+
+        results = []
+        for text, processed_text, probs, idx in zip(
+            texts, processed_texts, probabilities, best
+        ):
+            # Prepare results
+            category = categories[idx]
+            confidence = probs[idx]
+
+            # Get probabilities for all categories
+            prob_dict = dict(zip(categories, probs))
+
+            # Generate explanation
+            explanation = self._generate_explanation(category, confidence, prob_dict)
+
+            results.append(
+                {
+                    "predicted_category": category,
+                    "confidence": confidence,
+                    "probabilities": prob_dict,
+                    "explanation": explanation,
+                    "model_used": self.model_type,
+                    "text_length": len(text),
+                    "processed_text_length": len(processed_text),
+                }
+            )
 
-        return {
-            "predicted_category": category,
-            "confidence": confidence,
-            "probabilities": prob_dict,
-            "explanation": explanation,
-            "model_used": self.model_type,
-            "text_length": len(text),
-            "processed_text_length": len(processed_text),
-        }
+        return results
 
     def _generate_explanation(
         self, category: str, confidence: float, probabilities: Dict[str, float]
@@ -408,6 +403,21 @@ def classify_document(text: str, model_type: str = "naive_bayes") -> Dict:
     return classifier.classify_text(text)
 
 
+def classify_documents(texts: List[str], model_type: str = "naive_bayes") -> List[Dict]:
+    """
+    Classify a batch of documents in one model call
+
+    Args:
+        texts: The texts to classify
+        model_type: The model type ('naive_bayes' or 'logistic_regression')
+
+    Returns:
+        List of classification result dictionaries, one per text
+    """
+    classifier = _get_classifier(model_type)
+    return classifier.classify_documents(texts)
+
+
 def get_model_info(model_type: str = "naive_bayes") -> Dict:
     """
     Get information about the classification model (for API compatibility)
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from pydantic import BaseModel
-from search import SearchEngine, load_publications
+from search import SearchEngine, file_mtime, load_publications
 from classification_ml import classify_document, get_model_info, train_models
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -21,9 +21,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load publications data once when the app starts
-publications_data = load_publications()
-search_engine = SearchEngine(publications_data)
+PUBLICATIONS_FILE = "../data/publications.json"
+SEARCH_INDEX_FILE = "../data/search_index.joblib"
+
+# Load publications data once when the app starts; the fitted search index is
+# reused from disk until the crawler rewrites publications.json. The mtime is
+# taken before parsing, so a rewrite landing mid-load invalidates the index.
+publications_mtime = file_mtime(PUBLICATIONS_FILE)
+publications_data = load_publications(PUBLICATIONS_FILE)
+search_engine = SearchEngine(
+    publications_data, index_path=SEARCH_INDEX_FILE, source_mtime=publications_mtime
+)
+
+# Standard fields returned for each publication
+RETURN_FIELDS = [
+    "title",
+    "link",
+    "authors",
+    "published_date",
+    "abstract",
+    "score",
+]
 
 
 # Pydantic models for request bodies
@@ -40,47 +58,32 @@ def read_root():
 @app.get("/search")
 def search_publications(query: str = "", page: int = 1, size: int = 30):
     try:
+        start_idx = (page - 1) * size
+        end_idx = start_idx + size
+
         # If no query provided, return all publications
         if not query.strip():
-            results = []
-            for pub in publications_data:
-                item = dict(pub)  # copy
-                item["score"] = 0.0  # no search score for all results
-
-                # Ensure authors is a list
-                if not isinstance(item.get("authors", []), list):
-                    item["authors"] = (
-                        item.get("authors", "").split(", ")
-                        if item.get("authors")
-                        else []
-                    )
-
-                # Return standard fields
-                return_fields = [
-                    "title",
-                    "link",
-                    "authors",
-                    "published_date",
-                    "abstract",
-                    "score",
-                ]
-                formatted_item = {k: item.get(k, "") for k in return_fields}
-                results.append(formatted_item)
+            # Only format the requested page; the rest would be discarded.
+            # Engine records are already normalized (authors list, unified
+            # published_date), so no per-item fix-ups are needed here.
+            publications = search_engine.publications
+            total = len(publications)
+            paginated_results = [
+                {**{k: pub.get(k, "") for k in RETURN_FIELDS}, "score": 0.0}
+                for pub in publications[start_idx:end_idx]
+            ]
         else:
             # Perform search using the initialized search engine
             results = search_engine.search(query)
-
-        # Apply pagination
-        start_idx = (page - 1) * size
-        end_idx = start_idx + size
-        paginated_results = results[start_idx:end_idx]
+            total = len(results)
+            paginated_results = results[start_idx:end_idx]
 
         return {
             "results": paginated_results,
-            "total": len(results),
+            "total": total,
             "page": page,
             "size": size,
-            "total_pages": (len(results) + size - 1) // size,
+            "total_pages": (total + size - 1) // size,
         }
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,41 @@
+# nlp.py — text preprocessing shared by the search engine and the classifier
+import re
+from functools import lru_cache
+from typing import Pattern
+
+import nltk
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
+
+
+# ---------- NLTK helpers ----------
+def _ensure_nltk():
+    try:
+        _ = stopwords.words("english")
+    except LookupError:
+        nltk.download("stopwords")
+
+
+_ensure_nltk()
+STEM = PorterStemmer()
+STOP = set(stopwords.words("english"))
+# Tokens are runs of [a-z0-9] in the lowercased text; everything else is a
+# separator, so no separate punctuation-stripping pass or Punkt is needed.
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=200_000)
+def stem(token: str) -> str:
+    """Porter-stem a token; corpora repeat tokens heavily, so memoize."""
+    return STEM.stem(token)
+
+
+def preprocess_text(text: str, token_re: Pattern = TOKEN_RE, min_len: int = 2) -> str:
+    """
+    Lowercase and tokenize text with token_re, drop stopwords and tokens
+    shorter than min_len, and stem the rest.
+    """
+    if not text:
+        return ""
+    tokens = token_re.findall(text.lower())
+    return " ".join(stem(t) for t in tokens if t not in STOP and len(t) >= min_len)
@@ -1,10 +1,16 @@
 # search_engine.py  — upgraded for crawler with abstract + published_date
-import json, re, nltk
-from typing import List, Dict
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
+import json, os
+import joblib
+import numpy as np
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from nlp import preprocess_text
+
+try:  # orjson parses large crawler dumps considerably faster
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ---------- IO ----------
@@ -16,41 +22,27 @@ def load_publications(
     Loads crawler output. Prefers publications.json (new crawler), falls back to publications_detailed.json.
     """
     try:
-        with open(filepath_primary, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        return _read_json(filepath_primary)
     except FileNotFoundError:
-        with open(filepath_fallback, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    return data
-
-
-# ---------- NLTK helpers ----------
-def _ensure_nltk():
-    try:
-        _ = stopwords.words("english")
-        nltk.word_tokenize("ok")
-    except LookupError:
-        nltk.download("stopwords")
-        nltk.download("punkt")
-        # Some environments need this extra package; ignore if unavailable
-        try:
-            nltk.download("punkt_tab")
-        except Exception:
-            pass
+        return _read_json(filepath_fallback)
 
 
-_ensure_nltk()
-STEM = PorterStemmer()
-STOP = set(stopwords.words("english"))
+def _read_json(filepath: str):
+    if orjson is None:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    with open(filepath, "rb") as f:
+        return orjson.loads(f.read())
 
 
-def preprocess_text(text: str) -> str:
-    if not text:
-        return ""
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    tokens = nltk.word_tokenize(text)
-    return " ".join(STEM.stem(t) for t in tokens if t not in STOP and len(t) > 1)
+def file_mtime(filepath: Optional[str]) -> Optional[float]:
+    """mtime of filepath, or None if it is missing."""
+    if not filepath:
+        return None
+    try:
+        return os.path.getmtime(filepath)
+    except OSError:
+        return None
 
 
 # ---------- normalization ----------
@@ -68,40 +60,56 @@ def _ensure_list_of_authors(v):
     return [{"name": str(v).strip(), "profile": None}]
 
 
-def _ensure_list_of_str(v):
-    """Convert authors to list of strings for search indexing."""
-    if not v:
-        return []
-    if isinstance(v, list):
-        # if list of author objects, extract names
-        if len(v) and isinstance(v[0], dict) and "name" in v[0]:
-            return [str(d.get("name", "")).strip() for d in v if isinstance(d, dict)]
-        # if list of strings, return as is
-        return [str(x).strip() for x in v]
-    # if a single string slipped in, keep it as a single element
-    return [str(v).strip()]
-
-
 def _normalize_record(r: Dict) -> Dict:
-    # unify date
-    date_val = r.get("date") or r.get("published_date") or ""
-    authors = _ensure_list_of_authors(r.get("authors", []))
-    abstract = r.get("abstract", "") or ""
     out = dict(r)
-    out["published_date"] = date_val
-    out["authors"] = authors
-    out["abstract"] = abstract
+    # unify date: crawler variants emit either "date" or "published_date"
+    out["published_date"] = r.get("date") or r.get("published_date") or ""
+    out["authors"] = _ensure_list_of_authors(r.get("authors", []))
+    out["abstract"] = r.get("abstract", "") or ""
     return out
 
 
 # ---------- Engine ----------
+# Bump whenever preprocessing or vectorizer settings change, so persisted
+# indexes built with the old settings are rebuilt instead of reused.
+INDEX_VERSION = 3
+
+
+def _make_vectorizer(max_df: float) -> TfidfVectorizer:
+    return TfidfVectorizer(
+        max_df=max_df, sublinear_tf=True, norm="l2", dtype=np.float32
+    )
+
+
 class SearchEngine:
-    def __init__(self, publications: List[Dict]):
+    def __init__(
+        self,
+        publications: List[Dict],
+        index_path: Optional[str] = None,
+        source_mtime: Optional[float] = None,
+    ):
+        """
+        index_path/source_mtime enable the on-disk index: the fitted vectorizer
+        and TF-IDF matrix are saved to index_path and reused (memory-mapped)
+        as long as the source file still has the mtime (see file_mtime) it
+        had when publications were read from it.
+        """
         # normalize all records so frontend fields always exist
         self.publications = [_normalize_record(p) for p in publications]
 
+        if not index_path:
+            source_mtime = None
+        if not self._load_index(index_path, source_mtime):
+            self._build_index()
+            self._save_index(index_path, source_mtime)
+
+        # paginating clients re-issue the same query; memoize full hit lists
+        # keyed on the preprocessed query (the index is static once built)
+        self._search_cached = lru_cache(maxsize=1024)(self._search_impl)
+
+    def _build_index(self):
         # Build searchable strings (title + authors + abstract)
-        self.searchable_content = []
+        searchable_content = []
         for pub in self.publications:
             title = pub.get("title", "")
             # Extract author names for search indexing
@@ -113,40 +121,100 @@ class SearchEngine:
                 ]
             )
             abstract = pub.get("abstract", "")
-            blob = f"{preprocess_text(title)} {preprocess_text(authors_text)} {preprocess_text(abstract)}"
-            self.searchable_content.append(blob)
+            # preprocessing is per-token, so one pass over the joined fields
+            # yields the same tokens as three separate passes
+            searchable_content.append(
+                preprocess_text(f"{title} {authors_text} {abstract}")
+            )
 
-        # TF-IDF over combined text
-        self.vectorizer = TfidfVectorizer()
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.searchable_content)
+        # TF-IDF over combined text; rows come out L2-normalized, so cosine
+        # similarity against a (normalized) query is a plain sparse dot product.
+        # float32 halves the bytes streamed per ranking mat-vec. Terms present
+        # in nearly every record carry no ranking signal, so they are pruned;
+        # singletons are kept since they are often the only hit for an
+        # author's name or a distinctive title word.
+        try:
+            self.vectorizer = _make_vectorizer(max_df=0.95)
+            self.tfidf_matrix = self.vectorizer.fit_transform(searchable_content)
+        except ValueError:
+            # tiny corpora (one record, or records sharing every term) can
+            # have nothing left after pruning; index them unpruned
+            self.vectorizer = _make_vectorizer(max_df=1.0)
+            self.tfidf_matrix = self.vectorizer.fit_transform(searchable_content)
+
+    def _load_index(self, index_path: Optional[str], source_mtime: Optional[float]):
+        if source_mtime is None or not os.path.exists(index_path):
+            return False
+        try:
+            version, mtime, n_docs, vectorizer, matrix = joblib.load(
+                index_path, mmap_mode="r"
+            )
+        except Exception:
+            return False
+        if (
+            version != INDEX_VERSION
+            or mtime != source_mtime
+            or n_docs != len(self.publications)
+        ):
+            return False
+        self.vectorizer, self.tfidf_matrix = vectorizer, matrix
+        return True
+
+    def _save_index(self, index_path: Optional[str], source_mtime: Optional[float]):
+        if source_mtime is None:
+            return
+        payload = (
+            INDEX_VERSION,
+            source_mtime,
+            len(self.publications),
+            self.vectorizer,
+            self.tfidf_matrix,
+        )
+        # write then rename, so concurrent workers never load a partial file
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            joblib.dump(payload, tmp_path)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            # the index is only a startup cache; serving works without it
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def search(self, query: str) -> List[Dict]:
         if not query.strip():
             return []
-
-        q_vec = self.vectorizer.transform([preprocess_text(query)])
-        sims = cosine_similarity(q_vec, self.tfidf_matrix).flatten()
-
-        # top 50 with a small threshold
-        top_idx = sims.argsort()[-50:][::-1]
+        # the cache holds only (index, score) pairs; response dicts (and the
+        # author entries in them) are built per call, so a caller mutating a
+        # hit can't alter the engine's records or later responses
         results = []
-        for i in top_idx:
-            score = float(sims[i])
-            if score < 0.01:
-                continue
-            item = dict(self.publications[i])  # copy
-            item["score"] = round(score, 2)
-
-            # Ensure required fields exist for frontend
-            return_fields = [
-                "title",
-                "link",
-                "authors",
-                "published_date",
-                "abstract",
-                "score",
-            ]
-            formatted_item = {k: item.get(k, "") for k in return_fields}
-            results.append(formatted_item)
-
+        for i, score in self._search_cached(preprocess_text(query)):
+            # records are normalized at ingest, so read fields straight off
+            # the source record instead of copying it first
+            pub = self.publications[i]
+            results.append(
+                {
+                    "title": pub.get("title", ""),
+                    "link": pub.get("link", ""),
+                    "authors": [
+                        dict(a) if isinstance(a, dict) else a for a in pub["authors"]
+                    ],
+                    "published_date": pub["published_date"],
+                    "abstract": pub["abstract"],
+                    "score": score,
+                }
+            )
         return results
+
+    def _search_impl(self, q_norm: str) -> Tuple[Tuple[int, float], ...]:
+        q_vec = self.vectorizer.transform([q_norm])
+        sims = (self.tfidf_matrix @ q_vec.T).toarray().ravel()
+
+        # top 50 with a small threshold; partition first so only the
+        # k best candidates get sorted
+        k = min(50, sims.size)
+        if k == 0:
+            return ()
+        idx = np.argpartition(sims, -k)[-k:]
+        top_idx = idx[np.argsort(-sims[idx])]
+        top_idx = top_idx[sims[top_idx] >= 0.01]
+        return tuple((int(i), round(float(sims[i]), 2)) for i in top_idx)
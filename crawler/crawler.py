@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import argparse, json, os, time, re, unicodedata, difflib
-from math import ceil
+import argparse, json, os, queue, time, re, threading, unicodedata, difflib
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
 from urllib.parse import urljoin, urlparse, quote
 
 # Selenium
@@ -24,6 +24,12 @@ from selenium.webdriver.support import expected_conditions as EC
 # Parallelism
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# Faster JSON when available (falls back to the stdlib)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------- Config ----------
 PORTAL_ROOT = "https://pureportal.coventry.ac.uk"
 PERSONS_PREFIX = "/en/persons/"
@@ -31,53 +37,83 @@ BASE_URL = f"{PORTAL_ROOT}/en/organisations/fbl-school-of-economics-finance-and-
 
 
 # =========================== Chrome helpers ===========================
+CHROME_ARGS = (
+    "--window-size=1366,900",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--lang=en-US",
+    "--disable-notifications",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-popup-blocking",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-features=CalculateNativeWinOcclusion,MojoVideoDecoder",
+    "--disable-plugins",
+    "--disable-background-networking",
+    "--memory-pressure-off",
+    "--disable-blink-features=AutomationControlled",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36",
+)
+# Moderate speed optimizations that preserve functionality
+CHROME_PREFS = {
+    "profile.default_content_setting_values": {
+        "plugins": 2,
+        "popups": 2,
+        "geolocation": 2,
+        "notifications": 2,
+        "media_stream": 2,
+    }
+}
+CHROME_EXCLUDE_SWITCHES = ["enable-logging", "enable-automation"]
+
+
+@lru_cache(maxsize=8)
+def _chrome_args(headless: bool, legacy_headless: bool) -> Tuple[str, ...]:
+    if not headless:
+        return CHROME_ARGS
+    return ("--headless" + ("" if legacy_headless else "=new"),) + CHROME_ARGS
+
+
 def build_chrome_options(headless: bool, legacy_headless: bool = False) -> Options:
+    # A fresh Options per driver (Selenium may mutate it), filled from the
+    # module-level spec instead of rebuilding the argument list every time
     opts = Options()
-    if headless:
-        opts.add_argument("--headless" + ("" if legacy_headless else "=new"))
-    opts.add_argument("--window-size=1366,900")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--lang=en-US")
-    opts.add_argument("--disable-notifications")
-    opts.add_argument("--no-first-run")
-    opts.add_argument("--no-default-browser-check")
-    opts.add_argument("--disable-extensions")
-    opts.add_argument("--disable-popup-blocking")
-    opts.add_argument("--disable-renderer-backgrounding")
-    opts.add_argument("--disable-backgrounding-occluded-windows")
-    opts.add_argument("--disable-features=CalculateNativeWinOcclusion,MojoVideoDecoder")
-    opts.add_argument("--disable-plugins")
-    opts.add_argument("--disable-background-networking")
-    opts.add_argument("--memory-pressure-off")
+    for arg in _chrome_args(headless, legacy_headless):
+        opts.add_argument(arg)
     opts.page_load_strategy = "eager"
-
-    # Moderate speed optimizations that preserve functionality
-    prefs = {
-        "profile.default_content_setting_values": {
-            "plugins": 2,
-            "popups": 2,
-            "geolocation": 2,
-            "notifications": 2,
-            "media_stream": 2,
-        }
-    }
-    opts.add_experimental_option("prefs", prefs)
-    opts.add_argument("--disable-blink-features=AutomationControlled")
-    opts.add_experimental_option(
-        "excludeSwitches", ["enable-logging", "enable-automation"]
-    )
+    opts.add_experimental_option("prefs", CHROME_PREFS)
+    opts.add_experimental_option("excludeSwitches", CHROME_EXCLUDE_SWITCHES)
     opts.add_experimental_option("useAutomationExtension", False)
-    opts.page_load_strategy = "eager"
-    opts.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
-    )
     return opts
 
 
+_CHROMEDRIVER_PATH: Optional[str] = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+
+def chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process (the manager stats its
+    cache, and may hit the network, on every install() call)."""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        with _CHROMEDRIVER_LOCK:
+            if _CHROMEDRIVER_PATH is None:
+                _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return _CHROMEDRIVER_PATH
+
+
+def use_chromedriver(path: str):
+    """Pin a local chromedriver binary so webdriver-manager is never consulted."""
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        _CHROMEDRIVER_PATH = path
+
+
 def make_driver(headless: bool, legacy_headless: bool = False) -> webdriver.Chrome:
-    service = ChromeService(ChromeDriverManager().install(), log_output=os.devnull)
+    service = ChromeService(chromedriver_path(), log_output=os.devnull)
     driver = webdriver.Chrome(
         service=service, options=build_chrome_options(headless, legacy_headless)
     )
@@ -95,13 +131,89 @@ def make_driver(headless: bool, legacy_headless: bool = False) -> webdriver.Chro
     return driver
 
 
+def _quit_driver(driver: webdriver.Chrome):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class ThreadDrivers:
+    """
+    One Chrome driver per worker thread, reused for every page that thread
+    handles. A driver is only replaced after it fails, not per page.
+    """
+
+    def __init__(self, headless: bool, legacy_headless: bool = False):
+        self.headless = headless
+        self.legacy_headless = legacy_headless
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._drivers: List[webdriver.Chrome] = []
+
+    def get(self) -> webdriver.Chrome:
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = make_driver(self.headless, self.legacy_headless)
+            self._local.driver = driver
+            self._local.cookies_handled = False
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    @property
+    def cookies_handled(self) -> bool:
+        """Whether this thread's driver already went through the cookie banner."""
+        return getattr(self._local, "cookies_handled", False)
+
+    @cookies_handled.setter
+    def cookies_handled(self, value: bool):
+        self._local.cookies_handled = value
+
+    def discard(self):
+        """Quit this thread's driver so its next get() starts a fresh one."""
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            return
+        self._local.driver = None
+        with self._lock:
+            self._drivers.remove(driver)
+        _quit_driver(driver)
+
+    def discard_if_dead(self):
+        """
+        discard() only if this thread's session is gone (browser crashed,
+        window closed). After a page-load timeout or a stale element the
+        browser still answers, so it is kept, as before.
+        """
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            return
+        try:
+            driver.current_url
+        except WebDriverException:
+            self.discard()
+
+    def quit_all(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            _quit_driver(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit_all()
+
+
 def accept_cookies_if_present(driver: webdriver.Chrome):
     try:
         btn = WebDriverWait(driver, 3).until(
             EC.presence_of_element_located((By.ID, "onetrust-accept-btn-handler"))
         )
+        # no settle delay: callers wait on the content they need next
         driver.execute_script("arguments[0].click();", btn)
-        time.sleep(0.1)
     except TimeoutException:
         pass
     except Exception:
@@ -114,16 +226,12 @@ NAME_PAIR = re.compile(
     r"[A-Z][A-Za-z'’\-]+,\s*(?:[A-Z](?:\.)?)(?:\s*[A-Z](?:\.)?)*", flags=re.UNICODE
 )
 SPACE = re.compile(r"\s+")
+NON_WORD = re.compile(r"[^\w\s\-']", flags=re.UNICODE)
 
 
 def _uniq_str(seq: List[str]) -> List[str]:
-    seen, out = set(), []
-    for x in seq:
-        x = x.strip()
-        if x and x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    # dict keys de-duplicate while keeping first-seen order
+    return list(dict.fromkeys(x for x in (s.strip() for s in seq) if x))
 
 
 def _uniq_authors(
@@ -141,10 +249,23 @@ def _uniq_authors(
     return out
 
 
+def _json_loads(txt: str):
+    return orjson.loads(txt) if orjson is not None else json.loads(txt)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON bytes; orjson encodes straight to bytes, no interim str."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode(
+        "utf-8"
+    )
+
+
 def _norm(s: str) -> str:
     s = unicodedata.normalize("NFKD", s)
     s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = re.sub(r"[^\w\s\-']", " ", s, flags=re.UNICODE).strip().lower()
+    s = NON_WORD.sub(" ", s).strip().lower()
     return SPACE.sub(" ", s)
 
 
@@ -178,10 +299,13 @@ def _looks_like_person_name(text: str) -> bool:
 
 
 # =========================== LISTING (Stage 1) ===========================
-def scrape_listing_page(driver: webdriver.Chrome, page_idx: int) -> List[Dict]:
+def scrape_listing_page(
+    driver: webdriver.Chrome, page_idx: int, accept_cookies: bool = True
+) -> List[Dict]:
     url = f"{BASE_URL}?page={page_idx}"
     driver.get(url)
-    accept_cookies_if_present(driver)
+    if accept_cookies:
+        accept_cookies_if_present(driver)
     try:
         WebDriverWait(driver, 10).until(
             lambda d: d.find_elements(By.CSS_SELECTOR, ".result-container h3.title a")
@@ -203,18 +327,20 @@ def scrape_listing_page(driver: webdriver.Chrome, page_idx: int) -> List[Dict]:
     return rows
 
 
-def scrape_single_listing_page(
-    page_idx: int, headless: bool = True, legacy_headless: bool = False
-) -> List[Dict]:
-    """Single page scraper for parallel execution"""
-    driver = make_driver(headless, legacy_headless)
+def scrape_single_listing_page(drivers: ThreadDrivers, page_idx: int) -> List[Dict]:
+    """Single page scraper for parallel execution (reuses the thread's driver)"""
     try:
-        return scrape_listing_page(driver, page_idx)
-    finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        # Consent is stored in the browser after its first page, so later
+        # pages on the same driver skip the 3s banner wait
+        rows = scrape_listing_page(
+            drivers.get(), page_idx, accept_cookies=not drivers.cookies_handled
+        )
+        drivers.cookies_handled = True
+        return rows
+    except WebDriverException:
+        # Restart the browser for this thread's next page if it died
+        drivers.discard_if_dead()
+        raise
 
 
 def gather_all_listing_links(
@@ -222,38 +348,52 @@ def gather_all_listing_links(
     headless_listing: bool = False,
     legacy_headless: bool = False,
     list_workers: int = 4,
+    out_queue: Optional[queue.Queue] = None,
 ) -> List[Dict]:
-    """Optimized parallel listing collection"""
+    """
+    Optimized parallel listing collection. If out_queue is given, each page's
+    rows are put on it as soon as the page is scraped, followed by a final
+    None sentinel, so detail scraping can start before listing finishes.
+    """
     print(
         f"[STAGE 1] Collecting links from {max_pages} pages with {list_workers} workers..."
     )
 
     all_rows: List[Dict] = []
+    drivers = ThreadDrivers(headless_listing, legacy_headless)
 
     # Use parallel processing for listing pages
-    with ThreadPoolExecutor(max_workers=list_workers) as executor:
-        future_to_page = {
-            executor.submit(
-                scrape_single_listing_page, i, headless_listing, legacy_headless
-            ): i
-            for i in range(max_pages)
-        }
-
-        completed = 0
-        for future in as_completed(future_to_page):
-            page_idx = future_to_page[future]
-            try:
-                rows = future.result()
-                if rows:
-                    all_rows.extend(rows)
-                    print(f"[LIST] Page {page_idx+1}/{max_pages} → {len(rows)} items")
-                else:
-                    print(
-                        f"[LIST] Page {page_idx+1}/{max_pages} → empty (stopping early)"
-                    )
-                completed += 1
-            except Exception as e:
-                print(f"[LIST] Page {page_idx+1} failed: {e}")
+    try:
+        with ThreadPoolExecutor(max_workers=list_workers) as executor:
+            future_to_page = {
+                executor.submit(scrape_single_listing_page, drivers, i): i
+                for i in range(max_pages)
+            }
+
+            completed = 0
+            for future in as_completed(future_to_page):
+                page_idx = future_to_page[future]
+                try:
+                    rows = future.result()
+                    if rows:
+                        all_rows.extend(rows)
+                        if out_queue is not None:
+                            for r in rows:
+                                out_queue.put(r)
+                        print(
+                            f"[LIST] Page {page_idx+1}/{max_pages} → {len(rows)} items"
+                        )
+                    else:
+                        print(
+                            f"[LIST] Page {page_idx+1}/{max_pages} → empty (stopping early)"
+                        )
+                    completed += 1
+                except Exception as e:
+                    print(f"[LIST] Page {page_idx+1} failed: {e}")
+    finally:
+        drivers.quit_all()
+        if out_queue is not None:
+            out_queue.put(None)
 
     uniq = {}
     for r in all_rows:
@@ -262,13 +402,77 @@ def gather_all_listing_links(
 
 
 # =========================== DETAIL (Stage 2) ===========================
+# Selectors are built once here rather than on every detail page.
+_LOWER = "'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'"
+EXPAND_BUTTONS_XPATH = (
+    f"//button[contains(translate(., {_LOWER}),'show') or "
+    f"contains(translate(., {_LOWER}),'more')]"
+)
+TAB_BAR_XPATHS = (
+    "//a[normalize-space()='Overview']",
+    "//nav[contains(@class,'tabbed-navigation')]",
+    "//div[contains(@class,'navigation') and .//a[contains(.,'Overview')]]",
+)
+DATE_SELECTORS = ("span.date", "time[datetime]", "time")
+ABSTRACT_SELECTORS = (
+    "section#abstract .textblock",
+    "section.abstract .textblock",
+    "div.abstract .textblock",
+    "div#abstract .textblock",
+    "section#abstract",
+    "div#abstract",
+    "[data-section='abstract'] .textblock",
+    ".abstract .textblock",
+    ".abstract p",
+    ".abstract div",
+    "div.textblock",
+)
+ABSTRACT_HEADING_XPATH = " | ".join(
+    f"//{h}[contains(translate(text(), {_LOWER}), 'abstract')]"
+    for h in ("h1", "h2", "h3", "h4")
+)
+ABSTRACT_FOLLOWING_XPATHS = (
+    "./following-sibling::div[1]",
+    "./following-sibling::p[1]",
+    "./following-sibling::section[1]",
+    "./following-sibling::*[1]",
+    "../following-sibling::div[1]",
+    "./parent::*/following-sibling::div[1]",
+)
+ABSTRACT_TEXT_XPATH = f"//*[contains(translate(text(), {_LOWER}), 'abstract')]"
+# Date + first-pass abstract lookup in a single WebDriver round trip (instead
+# of a find/get call per selector and per candidate element). Like Selenium's
+# .text, elements without layout boxes (hidden) count as having no text.
+EXTRACT_FIELDS_JS = """
+const [dateSels, abstractSels, minLen] = arguments;
+const text = el => (el.getClientRects().length ? (el.innerText || "").trim() : "");
+let date = null;
+for (const sel of dateSels) {
+  const el = document.querySelector(sel);
+  if (!el) continue;
+  date = el.getAttribute("datetime") || text(el);
+  if (date) break;
+}
+let abstract = "";
+outer: for (const sel of abstractSels) {
+  for (const el of document.querySelectorAll(sel)) {
+    const t = text(el);
+    if (t.length > minLen) { abstract = t; break outer; }
+  }
+}
+return {date: date, abstract: abstract};
+"""
+ABSTRACT_META_SELECTORS = (
+    'meta[name="description"]',
+    'meta[name="abstract"]',
+    'meta[property="og:description"]',
+    'meta[name="citation_abstract"]',
+)
+
+
 def _maybe_expand_authors(driver: webdriver.Chrome):
     try:
-        for b in driver.find_elements(
-            By.XPATH,
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'show') or "
-            "contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'more')]",
-        )[:2]:
+        for b in driver.find_elements(By.XPATH, EXPAND_BUTTONS_XPATH)[:2]:
             try:
                 driver.execute_script(
                     "arguments[0].scrollIntoView({block:'center'});", b
@@ -289,11 +493,7 @@ def _authors_from_header_anchors(driver: webdriver.Chrome) -> List[Dict]:
     """
     # Find Y threshold of tab bar
     tabs_y = None
-    for xp in [
-        "//a[normalize-space()='Overview']",
-        "//nav[contains(@class,'tabbed-navigation')]",
-        "//div[contains(@class,'navigation') and .//a[contains(.,'Overview')]]",
-    ]:
+    for xp in TAB_BAR_XPATHS:
         try:
             el = driver.find_element(By.XPATH, xp)
             tabs_y = el.location.get("y", None)
@@ -346,8 +546,6 @@ def _get_meta_list(driver: webdriver.Chrome, names_or_props: List[str]) -> List[
 
 
 def _extract_authors_jsonld(driver: webdriver.Chrome) -> List[str]:
-    import json as _json
-
     names = []
     for s in driver.find_elements(
         By.CSS_SELECTOR, 'script[type="application/ld+json"]'
@@ -356,7 +554,7 @@ def _extract_authors_jsonld(driver: webdriver.Chrome) -> List[str]:
         if not txt:
             continue
         try:
-            data = _json.loads(txt)
+            data = _json_loads(txt)
         except Exception:
             continue
         objs = data if isinstance(data, list) else [data]
@@ -383,7 +581,9 @@ def _authors_from_subtitle_simple(
 ) -> List[str]:
     """
     Use the subtitle line containing authors + date:
-    strip title, cut before first digit (date), parse 'Surname, Initials' pairs.
+    strip title, then parse 'Surname, Initials' pairs up to the first digit
+    (date). NAME_PAIR only matches name-shaped runs, so '&'/'and' separators
+    need no rewriting and the line is scanned in place, without copies.
     """
     try:
         date_el = driver.find_element(By.CSS_SELECTOR, "span.date")
@@ -403,9 +603,7 @@ def _authors_from_subtitle_simple(
         line = line.replace(title_text, "")
     line = " ".join(line.split()).strip()
     m = FIRST_DIGIT.search(line)
-    pre_date = line[: m.start()].strip(" -—–·•,;|") if m else line
-    pre_date = pre_date.replace(" & ", ", ").replace(" and ", ", ")
-    pairs = NAME_PAIR.findall(pre_date)
+    pairs = NAME_PAIR.findall(line, 0, m.start() if m else len(line))
     return _uniq_str(pairs)
 
 
@@ -429,7 +627,8 @@ def extract_detail_for_link(
             EC.presence_of_element_located((By.CSS_SELECTOR, "h1"))
         )
     except TimeoutException:
-        time.sleep(1)
+        # already waited 8s; fall through to the title_hint fallback
+        pass
 
     try:
         title = driver.find_element(By.CSS_SELECTOR, "h1").text.strip()
@@ -437,11 +636,7 @@ def extract_detail_for_link(
         title = title_hint or ""
 
     try:
-        for b in driver.find_elements(
-            By.XPATH,
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'show') or "
-            "contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'more')]",
-        )[:2]:
+        for b in driver.find_elements(By.XPATH, EXPAND_BUTTONS_XPATH)[:2]:
             try:
                 b.click()
                 time.sleep(0.1)
@@ -481,65 +676,25 @@ def extract_detail_for_link(
         except:
             pass
 
-    # FAST DATE EXTRACTION with fallback
-    published_date = None
-    for sel in ["span.date", "time[datetime]", "time"]:
-        try:
-            el = driver.find_element(By.CSS_SELECTOR, sel)
-            published_date = el.get_attribute("datetime") or el.text.strip()
-            if published_date:
-                break
-        except:
-            continue
-
-    abstract_txt = ""
-
-    # Method 1: Try standard abstract selectors
-    abstract_selectors = [
-        "section#abstract .textblock",
-        "section.abstract .textblock",
-        "div.abstract .textblock",
-        "div#abstract .textblock",
-        "section#abstract",
-        "div#abstract",
-        "[data-section='abstract'] .textblock",
-        ".abstract .textblock",
-        ".abstract p",
-        ".abstract div",
-        "div.textblock",
-    ]
-
-    for sel in abstract_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, sel)
-            for el in elements:
-                txt = el.text.strip()
-                if len(txt) > 30:
-                    abstract_txt = txt
-                    break
-            if abstract_txt:
-                break
-        except:
-            continue
+    # FAST DATE EXTRACTION + Method 1 for the abstract (standard abstract
+    # selectors), both resolved in-page with one script call
+    try:
+        fields = driver.execute_script(
+            EXTRACT_FIELDS_JS, list(DATE_SELECTORS), list(ABSTRACT_SELECTORS), 30
+        ) or {}
+    except Exception:
+        fields = {}
+    published_date = fields.get("date") or None
+    abstract_txt = fields.get("abstract") or ""
 
     # Method 2: Look for heading with "Abstract" and get following content
     if not abstract_txt:
         try:
-            abstract_headings = driver.find_elements(
-                By.XPATH,
-                "//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'abstract')] | //h2[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'abstract')] | //h3[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'abstract')] | //h4[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'abstract')]",
-            )
+            abstract_headings = driver.find_elements(By.XPATH, ABSTRACT_HEADING_XPATH)
 
             for h in abstract_headings:
                 # Try multiple ways to get following content
-                for xpath in [
-                    "./following-sibling::div[1]",
-                    "./following-sibling::p[1]",
-                    "./following-sibling::section[1]",
-                    "./following-sibling::*[1]",
-                    "../following-sibling::div[1]",
-                    "./parent::*/following-sibling::div[1]",
-                ]:
+                for xpath in ABSTRACT_FOLLOWING_XPATHS:
                     try:
                         next_el = h.find_element(By.XPATH, xpath)
                         txt = next_el.text.strip()
@@ -557,10 +712,7 @@ def extract_detail_for_link(
     if not abstract_txt:
         try:
             # Find any element containing "Abstract" and try to get text from parent or siblings
-            abstract_elements = driver.find_elements(
-                By.XPATH,
-                "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'abstract')]",
-            )
+            abstract_elements = driver.find_elements(By.XPATH, ABSTRACT_TEXT_XPATH)
             for elem in abstract_elements:
                 # Try parent element
                 try:
@@ -582,13 +734,7 @@ def extract_detail_for_link(
     # Method 4: Try meta tags for abstract/description
     if not abstract_txt:
         try:
-            meta_selectors = [
-                'meta[name="description"]',
-                'meta[name="abstract"]',
-                'meta[property="og:description"]',
-                'meta[name="citation_abstract"]',
-            ]
-            for sel in meta_selectors:
+            for sel in ABSTRACT_META_SELECTORS:
                 try:
                     meta = driver.find_element(By.CSS_SELECTOR, sel)
                     content = meta.get_attribute("content")
@@ -636,46 +782,103 @@ def extract_detail_for_link(
 
 
 # =========================== Workers ===========================
-def worker_detail_batch(
-    batch: List[Dict], headless: bool, legacy_headless: bool
-) -> List[Dict]:
-    driver = make_driver(headless=headless, legacy_headless=legacy_headless)
-    out: List[Dict] = []
+def scrape_one_detail(drivers: ThreadDrivers, it: Dict) -> Optional[Dict]:
+    """
+    Scrape one detail page on the calling thread's reused driver. Returns None
+    if the page failed; a driver that cannot start raises, so the run stops
+    instead of turning every link into an empty record.
+    """
+    driver = drivers.get()
     try:
-        for i, it in enumerate(batch, 1):
-            try:
-                rec = extract_detail_for_link(driver, it["link"], it.get("title", ""))
-                out.append(rec)
-                if i % 2 == 0:
-                    print(f"[WORKER] {i}/{len(batch)} parsed")
-            except Exception as e:
-                print(f"[WORKER] ERR {it['link']}: {str(e)[:100]}")
-                # Add minimal record to avoid data loss
-                out.append(
-                    {
-                        "title": it.get("title", ""),
-                        "link": it["link"],
-                        "authors": [],
-                        "published_date": None,
-                        "abstract": "",
-                    }
-                )
-                continue
-    finally:
+        return extract_detail_for_link(driver, it["link"], it.get("title", ""))
+    except Exception as e:
+        print(f"[WORKER] ERR {it['link']}: {str(e)[:100]}")
+        if isinstance(e, WebDriverException):
+            # Restart the browser for this thread's next page if it died
+            drivers.discard_if_dead()
+        return None
+
+
+def fallback_record(it: Dict) -> Dict:
+    """Minimal record for a page that failed, to avoid data loss."""
+    return {
+        "title": it.get("title", ""),
+        "link": it["link"],
+        "authors": [],
+        "published_date": None,
+        "abstract": "",
+    }
+
+
+# =========================== Output ===========================
+def merge_rows(listing: List[Dict], results: List[Dict]) -> Iterator[Dict]:
+    """
+    Final rows in listing order, detail records replacing bare listing rows;
+    details whose link is not in this run's listing (e.g. resumed) come last.
+    """
+    details = {rec["link"]: rec for rec in results}
+    for it in listing:
+        rec = details.pop(it["link"], None)
+        yield rec if rec is not None else {"title": it["title"], "link": it["link"]}
+    yield from details.values()
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file + rename, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_json_array(path: Path, rows: Iterable[Dict]) -> int:
+    """
+    Stream rows to path as an indented JSON array (same layout as indent=2),
+    encoding one row at a time instead of the whole list. Goes through a temp
+    file + rename like write_atomic. Returns the number of rows written.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    n = 0
+    with tmp.open("wb") as f:
+        f.write(b"[")
+        for row in rows:
+            f.write(b",\n  " if n else b"\n  ")
+            # raw newlines in encoded JSON are only layout, never string data
+            f.write(_json_dumps(row, indent=True).replace(b"\n", b"\n  "))
+            n += 1
+        f.write(b"\n]" if n else b"]")
+    os.replace(tmp, path)
+    return n
+
+
+# =========================== Checkpoint ===========================
+def load_checkpoint(path: Path) -> List[Dict]:
+    """
+    Detail records saved by an interrupted run. A torn last line (crash
+    mid-write) is skipped and terminated, so new appends start on a fresh line.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    if data and not data.endswith(b"\n"):
+        with path.open("ab") as f:
+            f.write(b"\n")
+    rows: List[Dict] = []
+    for line in data.splitlines():
         try:
-            driver.quit()
-        except Exception:
-            pass
-    return out
+            rows.append(_json_loads(line))
+        except ValueError:
+            continue
+    return rows
 
 
-def chunk(items: List[Dict], n: int) -> List[List[Dict]]:
-    """Optimized chunking for better parallelism"""
-    if n <= 1:
-        return [items]
-    # Create smaller chunks for better parallelism
-    size = max(3, ceil(len(items) / (n * 2)))
-    return [items[i : i + size] for i in range(0, len(items), size)]
+def append_checkpoint(f, rows: List[Dict]):
+    """Append rows as JSON lines and force them to disk before returning."""
+    if not rows:
+        return
+    f.write(b"".join(_json_dumps(r) + b"\n" for r in rows))
+    f.flush()
+    os.fsync(f.fileno())
 
 
 # =========================== Orchestrator ===========================
@@ -705,81 +908,156 @@ def main():
     ap.add_argument(
         "--legacy-headless", action="store_true", help="Use legacy --headless."
     )
+    ap.add_argument(
+        "--chromedriver-path",
+        default=None,
+        help="Use this chromedriver binary instead of webdriver-manager.",
+    )
+    ap.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip links already saved in publications_partial.jsonl by an interrupted run.",
+    )
     args = ap.parse_args()
 
+    if args.chromedriver_path:
+        use_chromedriver(args.chromedriver_path)
+
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
     start_time = time.time()
 
-    # -------- Stage 1: Optimized parallel listing
+    # -------- Stage 1 + 2: listing feeds detail workers as pages complete
     print(f"[STAGE 1] Collecting links (up to {args.max_pages} pages)…")
-    listing = gather_all_listing_links(
-        args.max_pages,
-        headless_listing=args.listing_headless,
-        legacy_headless=args.legacy_headless,
-        list_workers=args.list_workers,
-    )
-    stage1_time = time.time() - start_time
-    print(f"[STAGE 1] Collected {len(listing)} unique links in {stage1_time:.1f}s.")
-
-    # Ensure data directory exists
-    if not listing:
-        print("No publications found on listing pages.")
-        return
+    print(f"[STAGE 2] Scraping details with {args.workers} headless workers…")
+    link_q: queue.Queue = queue.Queue()
+    # Every finished page is appended here, so a crash loses at most the
+    # pages still in flight
+    partial_path = outdir / "publications_partial.jsonl"
+    results: List[Dict] = load_checkpoint(partial_path) if args.resume else []
+    if results:
+        print(f"[RESUME] {len(results)} records already scraped; skipping them.")
+    # Drivers and checkpoint are listed before the pool, so the pool (and any
+    # checkpoint callbacks still running on it) is joined before they close
+    with ThreadPoolExecutor(max_workers=1) as producer, ThreadDrivers(
+        True, args.legacy_headless
+    ) as detail_drivers, partial_path.open(
+        "ab" if args.resume else "wb"
+    ) as partial, ThreadPoolExecutor(
+        max_workers=max(1, args.workers)
+    ) as ex:
+        listing_fut = producer.submit(
+            gather_all_listing_links,
+            args.max_pages,
+            args.listing_headless,
+            args.legacy_headless,
+            args.list_workers,
+            link_q,
+        )
 
-    (outdir / "publications_links.json").write_text(
-        json.dumps(listing, indent=2), encoding="utf-8"
-    )
+        # Launch the detail browsers now, while the first listing pages load,
+        # instead of when the first links arrive
+        warm = [ex.submit(detail_drivers.get) for _ in range(max(1, args.workers))]
+
+        checkpoint_lock = threading.Lock()
+
+        def checkpoint(fut):
+            # Runs as each page finishes, also while Stage 1 is still listing.
+            # Failed pages are not saved, so --resume retries them.
+            if fut.cancelled() or fut.exception() is not None:
+                return
+            rec = fut.result()
+            if rec is not None:
+                with checkpoint_lock:
+                    append_checkpoint(partial, [rec])
+
+        # One future per link, submitted as soon as it comes off the queue:
+        # idle workers take the next URL, so a slow page never holds up others
+        futs: Dict = {}
+        seen = {r["link"] for r in results}
+        while True:
+            it = link_q.get()
+            if it is None:
+                break
+            if it["link"] in seen:
+                continue
+            seen.add(it["link"])
+            fut = ex.submit(scrape_one_detail, detail_drivers, it)
+            fut.add_done_callback(checkpoint)
+            futs[fut] = it
+
+        listing = listing_fut.result()
+        stage1_time = time.time() - start_time
+        print(f"[STAGE 1] Collected {len(listing)} unique links in {stage1_time:.1f}s.")
+
+        # Ensure data directory exists
+        if not listing:
+            print("No publications found on listing pages.")
+            return
+
+        write_atomic(
+            outdir / "publications_links.json",
+            _json_dumps(listing, indent=True),
+        )
 
-    # -------- Stage 2: details (parallel; no per-item sleep)
-    print(f"[STAGE 2] Scraping details with {args.workers} headless workers…")
-    stage2_start = time.time()
-    batches = chunk(listing, max(1, args.workers))
-    results: List[Dict] = []
-    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
-        futs = [
-            ex.submit(worker_detail_batch, batch, True, args.legacy_headless)
-            for batch in batches
-        ]
         done = 0
-        for fut in as_completed(futs):
-            part = fut.result() or []
-            results.extend(part)
-            done += 1
-            print(
-                f"[STAGE 2] Completed {done}/{len(batches)} batches (+{len(part)} items)"
-            )
+        last_log = time.monotonic()
+        failed: List[Dict] = []
+        try:
+            # a browser that failed to start surfaces here (or from the
+            # first page that needed it) and aborts the run
+            for fut in warm:
+                fut.result()
+            for fut in as_completed(futs):
+                rec = fut.result()
+                if rec is None:
+                    failed.append(fallback_record(futs[fut]))
+                else:
+                    results.append(rec)
+                done += 1
+                # at most one progress line every 10s, however fast pages finish
+                now = time.monotonic()
+                if now - last_log >= 10 or done == len(futs):
+                    last_log = now
+                    rate = done / max(time.time() - start_time, 1e-9)
+                    eta = (len(futs) - done) / rate
+                    print(
+                        f"[STAGE 2] Completed {done}/{len(futs)} pages "
+                        f"({rate:.1f}/s, ETA {eta:.0f}s)"
+                    )
+        except Exception:
+            for fut in futs:
+                fut.cancel()
+            raise
+
+    if failed and not results:
+        # e.g. the site or browser broke mid-run: keep the last good output
+        print(f"[STAGE 2] All {len(failed)} detail pages failed; not saving.")
+        return
 
-    stage2_time = time.time() - stage2_start
+    # Stage 2 runs alongside Stage 1, so it is timed from the start
+    stage2_time = time.time() - start_time
     total_time = time.time() - start_time
 
     # -------- Save (prefer detail results)
-    by_link: Dict[str, Dict] = {}
-    for it in listing:
-        by_link[it["link"]] = {"title": it["title"], "link": it["link"]}
-    for rec in results:
-        by_link[rec["link"]] = rec
-
-    final_rows = list(by_link.values())
     out_path = outdir / "publications.json"
-    out_path.write_text(
-        json.dumps(final_rows, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    n_rows = write_json_array(out_path, merge_rows(listing, results + failed))
+    partial_path.unlink(missing_ok=True)
 
     # Performance summary
     print(f"\n{'='*60}")
     print(f"[PERFORMANCE SUMMARY]")
-    print(f"Total items processed: {len(final_rows)}")
+    print(f"Total items processed: {n_rows}")
     print(f"Stage 1 (listing): {stage1_time:.1f}s")
-    print(f"Stage 2 (details): {stage2_time:.1f}s")
+    print(f"Stage 2 (details, overlapped with listing): {stage2_time:.1f}s")
     print(f"Total time: {total_time:.1f}s")
-    print(f"Average time per item: {total_time/len(final_rows):.2f}s")
-    print(f"Items per minute: {(len(final_rows) * 60 / total_time):.1f}")
-    if len(final_rows) >= 50:
-        time_for_50_pages = (50 * total_time) / (len(final_rows) / args.max_pages)
+    print(f"Average time per item: {total_time/n_rows:.2f}s")
+    print(f"Items per minute: {(n_rows * 60 / total_time):.1f}")
+    if n_rows >= 50:
+        time_for_50_pages = (50 * total_time) / (n_rows / args.max_pages)
         print(f"Estimated time for 50 pages: ~{time_for_50_pages/60:.1f} minutes")
-    print(f"[DONE] Saved {len(final_rows)} records → {out_path}")
+    print(f"[DONE] Saved {n_rows} records → {out_path}")
     print(f"{'='*60}")
 
 